@@ -3,8 +3,11 @@
 
 import mimetypes
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Mapping
+from urllib.error import HTTPError
 from urllib.parse import urlparse
 from urllib.request import Request, urlopen
 
@@ -15,14 +18,14 @@ if TYPE_CHECKING:
 
 
 def check_entity_values(
-    entity: "Entity", check_rules: Dict[str, Callable[[Any], bool]]
+    entity: "Entity", check_rules: Mapping[str, Callable[[Any], bool]]
 ) -> EntityError:
     """
     Check if the values of the given Entity object are valid.
 
     Args:
         entity (Entity): The Entity object whose values will be checked.
-        check_rules (Dict[str, Callable[[Any], bool]]): A dictionary whose keys are the names of attributes of the Entity object and whose values are check functions that take the attribute value as argument and return a boolean indicating whether the value is valid or not.
+        check_rules (Mapping[str, Callable[[Any], bool]]): A dictionary whose keys are the names of attributes of the Entity object and whose values are check functions that take the attribute value as argument and return a boolean indicating whether the value is valid or not.
 
     Returns:
         EntityError: An EntityError object that contains information about invalid attribute values of the Entity object. If all attribute values are valid, an empty EntityError object is returned.
@@ -42,6 +45,15 @@ def check_entity_values(
 
 # === Check functions ===
 
+CONTENT_SIZE_PATTERN = re.compile(r"^\d+[KMGTP]?B$")
+URL_PATTERN = re.compile(r"^https?://.+$")
+ISO8601_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+EMAIL_PATTERN = re.compile(r"(mailto:)?[\w\.-]+@[\w\.-]+\.\w+$")
+PHONE_NUMBER_PATTERN = re.compile(
+    r"^\+?\d{1,4}?[-. ]?\(?(?:\d{1,3}?\)?[-. ]?\d{1,4})(?:[-. ]?\d{1,4}){0,2}$"
+)
+ORCID_PATTERN = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[0-9X]$")
+
 
 def is_content_size(value: str) -> bool:
     """
@@ -53,9 +65,11 @@ def is_content_size(value: str) -> bool:
     Returns:
         bool: True if the value is a valid content size format (e.g., '1KB', '1MB', '1GB', etc), False otherwise.
     """
-    return re.match(r"^\d+[KMGTP]?B$", value) is not None
+    return CONTENT_SIZE_PATTERN.match(value) is not None
 
 
+# Bounded, as the values come from API requests
+@lru_cache(maxsize=256)
 def is_encoding_format(value: str) -> bool:
     """
     Check if the value is a valid encoding format.
@@ -79,7 +93,13 @@ def is_sha256(value: str) -> bool:
     Returns:
         bool: True if the value is a valid SHA256 format (e.g., '1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef'), False otherwise.
     """
-    return re.match(r"^[0-9a-fA-F]{64}$", value) is not None
+    if len(value) != 64:
+        return False
+    try:
+        # bytes.fromhex() skips whitespace, so check the number of parsed bytes as well
+        return len(bytes.fromhex(value)) == 32
+    except ValueError:
+        return False
 
 
 def is_url(value: str) -> bool:
@@ -92,7 +112,7 @@ def is_url(value: str) -> bool:
     Returns:
         bool: True if the value is a valid URL format (e.g., 'https://example.com'), False otherwise.
     """
-    return re.match(r"^https?://.+$", value) is not None
+    return URL_PATTERN.match(value) is not None
 
 
 def is_relative_path(value: str) -> bool:
@@ -117,7 +137,8 @@ def is_relative_path(value: str) -> bool:
         >>> is_relative_path("file:///data.csv")
         False
     """
-    if urlparse(value).scheme:
+    # A scheme is always followed by ':', so skip urlparse() for plain paths
+    if ":" in value and urlparse(value).scheme:
         # Check if the value has a scheme (e.g., http://, https://, file://, etc)
         return False
 
@@ -146,7 +167,8 @@ def is_absolute_path(value: str) -> bool:
         >>> is_absolute_path("file:///data.csv")
         True
     """
-    if urlparse(value).scheme:
+    # A scheme is always followed by ':', so skip urlparse() for plain paths
+    if ":" in value and urlparse(value).scheme:
         if value.startswith("file://"):
             return True
         return False
@@ -164,7 +186,7 @@ def is_iso8601(value: str) -> bool:
     Returns:
         bool: True if the value is a valid ISO 8601 format (e.g., '2021-01-01T00:00:00Z'), False otherwise.
     """
-    return re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$", value) is not None
+    return ISO8601_PATTERN.match(value) is not None
 
 
 def is_email(value: str) -> bool:
@@ -177,7 +199,7 @@ def is_email(value: str) -> bool:
     Returns:
         bool: True if the value is a valid email format (e.g., 'test@example.com', 'mailto:test@example.com'), False otherwise.
     """
-    return re.match(r"(mailto:)?[\w\.-]+@[\w\.-]+\.\w+$", value) is not None
+    return EMAIL_PATTERN.match(value) is not None
 
 
 def is_phone_number(value: str) -> bool:
@@ -208,13 +230,7 @@ def is_phone_number(value: str) -> bool:
             1 555.123.4567
             555.123.4567.890
     """
-    return (
-        re.match(
-            r"^\+?\d{1,4}?[-. ]?\(?(?:\d{1,3}?\)?[-. ]?\d{1,4})(?:[-. ]?\d{1,4}){0,2}$",
-            value,
-        )
-        is not None
-    )
+    return PHONE_NUMBER_PATTERN.match(value) is not None
 
 
 def is_orcid(value: str) -> bool:
@@ -227,12 +243,16 @@ def is_orcid(value: str) -> bool:
     Returns:
         bool: True if the value is a valid ORCID format (e.g., '0000-0002-1825-0097'), False otherwise.
     """
-    return re.match(r"^\d{4}-\d{4}-\d{4}-\d{3}[0-9X]$", value) is not None
+    return ORCID_PATTERN.match(value) is not None
+
+
+URL_ACCESS_TIMEOUT = 30  # seconds
 
 
 def is_url_accessible(url: str) -> bool:
     """
     Check if a URL is accessible using HEAD request.
+    If the server does not allow HEAD requests (405 Method Not Allowed), GET request is used instead.
 
     Args:
         url (str): The URL to be checked.
@@ -240,9 +260,35 @@ def is_url_accessible(url: str) -> bool:
     Returns:
         bool: True if the URL is accessible, False otherwise.
     """
-    try:
-        req = Request(url, method="HEAD")
-        res = urlopen(req)
-        return res.status < 400  # type: ignore
-    except Exception:
-        return False
+    for method in ("HEAD", "GET"):
+        try:
+            with urlopen(
+                Request(url, method=method), timeout=URL_ACCESS_TIMEOUT
+            ) as res:
+                return res.status < 400  # type: ignore
+        except HTTPError as e:
+            if e.code != 405:
+                return False
+        except Exception:
+            return False
+
+    return False
+
+
+def are_urls_accessible(urls: Iterable[str], max_workers: int = 16) -> Dict[str, bool]:
+    """
+    Check if the URLs are accessible, sending the HEAD requests concurrently.
+
+    Args:
+        urls (Iterable[str]): The URLs to be checked. Duplicated URLs are checked only once.
+        max_workers (int): The maximum number of requests sent at the same time.
+
+    Returns:
+        Dict[str, bool]: A dictionary whose keys are the URLs and whose values are the results of is_url_accessible().
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if len(unique_urls) == 0:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+        return dict(zip(unique_urls, executor.map(is_url_accessible, unique_urls)))
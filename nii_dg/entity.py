@@ -6,7 +6,7 @@ Defines the Entity class and its subclasses used in the nii_dg package.
 """
 
 from collections.abc import MutableMapping
-from typing import TYPE_CHECKING, Any, Dict, Type
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Type
 
 import yaml
 
@@ -29,8 +29,19 @@ class Entity(TypedMutableMapping):
 
     An Entity is a JSON-LD object that must have an "@id" property, an "@type" property, and an "@context" property.
     The properties and their expected types of an Entity are defined in its schema definition.
+
+    Attributes:
+        entity_name (str): The name of the Entity, which is the class name by default.
     """
 
+    entity_name: ClassVar[str] = "Entity"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Set entity_name once per class, instead of looking up the class name on each access.
+        if "entity_name" not in cls.__dict__:
+            cls.entity_name = cls.__name__
+
     def __init__(
         self, id_: str, props: Dict[str, Any], schema_name: str, entity_def: EntityDef
     ) -> None:
@@ -115,11 +126,6 @@ class Entity(TypedMutableMapping):
         """Return the context of the Entity."""
         return self["@context"]  # type: ignore
 
-    @property
-    def entity_name(self) -> str:
-        """Return the name of the Entity."""
-        return self.__class__.__name__
-
     @classmethod
     def from_jsonld(cls: Type["Entity"], jsonld: Dict[str, Any]) -> "Entity":
         """
@@ -162,7 +168,8 @@ class Entity(TypedMutableMapping):
             Dict[str, Any]: The JSON-LD representation of the Entity.
         """
         ref_data: Dict[str, Any] = {}
-        for key, val in self.items():
+        # Iterate the underlying dict, as Mapping.items() looks up each key via __getitem__
+        for key, val in self.data.items():
             if isinstance(val, dict):
                 # expect: {"@id": "xxx"}, {"@value": "xxx"}
                 ref_data[key] = val
@@ -189,11 +196,18 @@ class Entity(TypedMutableMapping):
         Raises:
             EntityError: If there are unexpected properties.
         """
+        # Take the set difference first, so that only the few remaining keys are checked for '@'.
+        unexpected_keys = {
+            key
+            for key in self.data.keys() - self.entity_def["props"].keys()
+            if not key.startswith("@")
+        }
+        if len(unexpected_keys) == 0:
+            return
+
         entity_error = EntityError(self)
         for key in self.keys():
-            if key.startswith("@"):
-                continue
-            if key not in self.entity_def["props"]:
+            if key in unexpected_keys:
                 entity_error.add(key, "Unexpected property.")
 
         if entity_error.has_error():
@@ -261,6 +275,17 @@ class Entity(TypedMutableMapping):
         self._check_required_props()
         self._check_prop_types()
 
+    def urls_to_access(self) -> List[str]:
+        """
+        Return the URLs whose accessibility is checked in validate().
+        ROCrate.validate() checks these URLs of all entities concurrently before validating each entity.
+        Override this method in subclasses that use crate.is_url_accessible() in validate().
+
+        Returns:
+            List[str]: The URLs to be accessed.
+        """
+        return []
+
     def validate(self, crate: "ROCrate") -> None:
         """
         Called at Data Governance validation time.
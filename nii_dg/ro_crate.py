@@ -6,9 +6,14 @@ Implementation of the RO-Crate class.
 """
 
 import json
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Tuple, Type,
+                    Union)
 
+from nii_dg.check_functions import are_urls_accessible, is_url_accessible
 from nii_dg.const import RO_CRATE_CONTEXT
 from nii_dg.entity import (ContextualEntity, DataEntity, DefaultEntity, Entity,
                            ROCrateMetadata, RootDataEntity)
@@ -18,6 +23,11 @@ from nii_dg.module_info import GH_REPO
 from nii_dg.utils import (DG_CONFIG, import_custom_class,
                           import_external_class, parse_ctx)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 class ROCrate:
     """
@@ -42,6 +52,11 @@ class ROCrate:
         default_entities (List[DefaultEntity]): The DefaultEntity list of the RO-Crate.
         data_entities (List[DataEntity]): The DataEntity list of the RO-Crate.
         contextual_entities (List[ContextualEntity]): The ContextualEntity list of the RO-Crate.
+
+    Note:
+        The entity lists are the source of truth, and may be modified directly.
+        While validate() is running, the entities are also indexed by '@id' and by class,
+        so that get_by_id() and get_by_type() called by each entity do not scan all entities.
     """
 
     def __init__(self, jsonld: Optional[Dict[str, Any]] = None) -> None:
@@ -54,6 +69,10 @@ class ROCrate:
         Raises:
             TypeError: If the entity type is not supported.
         """
+        # Only set while validate() is running, see get_validation_cache() and _build_index()
+        self._validation_cache: Optional[Dict[str, Any]] = None
+        self._by_id: Optional[Dict[str, List[Entity]]] = None
+        self._by_type: Optional[Dict[Type[Entity], List[Entity]]] = None
         if jsonld is not None:
             self.from_jsonld(jsonld)
         else:
@@ -61,8 +80,24 @@ class ROCrate:
             self.default_entities: List[DefaultEntity] = [self.root, ROCrateMetadata()]
             self.data_entities: List[DataEntity] = []
             self.contextual_entities: List[ContextualEntity] = []
+            self.root["hasPart"] = self.data_entities
 
-        self.root["hasPart"] = self.data_entities
+    def _build_index(self) -> None:
+        """
+        Build the indexes of the entities by '@id' and by class from the entity lists.
+        """
+        self._by_id = {}
+        self._by_type = {}
+        for entity in self._iter_entities():
+            self._by_id.setdefault(entity.id, []).append(entity)
+            self._by_type.setdefault(type(entity), []).append(entity)
+
+    def _clear_index(self) -> None:
+        """
+        Discard the indexes, so that the lookups scan the entity lists again.
+        """
+        self._by_id = None
+        self._by_type = None
 
     def add(self, *entities: Entity) -> None:
         """
@@ -75,12 +110,13 @@ class ROCrate:
             TypeError: If the entity type is not supported.
         """
         for entity in entities:
-            if isinstance(entity, DefaultEntity):
-                self.default_entities.append(entity)
-            elif isinstance(entity, DataEntity):
-                self.data_entities.append(entity)
-            elif isinstance(entity, ContextualEntity):
-                self.contextual_entities.append(entity)
+            category = _entity_category(type(entity))
+            if category is DefaultEntity:
+                self.default_entities.append(entity)  # type: ignore
+            elif category is DataEntity:
+                self.data_entities.append(entity)  # type: ignore
+            elif category is ContextualEntity:
+                self.contextual_entities.append(entity)  # type: ignore
             else:
                 raise TypeError(
                     "'Entity' class is not supported to be added directly. Please use 'DefaultEntity', 'DataEntity', or 'ContextualEntity' instead."
@@ -103,17 +139,18 @@ class ROCrate:
             If the entity is not included in the RO-Crate, a ValueError is raised.
         """
         for entity in entities:
-            if entity not in self.all_entities:
+            if not any(entity is ent for ent in self._iter_entities()):
                 raise ValueError(f"Entity {entity} is not included in the RO-Crate.")
 
-            if isinstance(entity, DefaultEntity):
+            category = _entity_category(type(entity))
+            if category is DefaultEntity:
                 raise ValueError(
                     f"Entity {entity} is a DefaultEntity and cannot be removed."
                 )
-            elif isinstance(entity, DataEntity):
-                self.data_entities.remove(entity)
-            elif isinstance(entity, ContextualEntity):
-                self.contextual_entities.remove(entity)
+            elif category is DataEntity:
+                _remove_same_object(self.data_entities, entity)
+            elif category is ContextualEntity:
+                _remove_same_object(self.contextual_entities, entity)
             else:
                 raise TypeError(
                     "'Entity' class is not supported to be removed directly. Please use 'DefaultEntity', 'DataEntity', or 'ContextualEntity' instead."
@@ -127,7 +164,18 @@ class ROCrate:
         Returns:
             A list of all entities in the RO-Crate.
         """
-        return self.default_entities + self.data_entities + self.contextual_entities  # type: ignore
+        return list(self._iter_entities())
+
+    def _iter_entities(self) -> Iterator[Entity]:
+        """
+        Iterate over all entities in the RO-Crate without building a new list.
+
+        Returns:
+            An iterator over all entities in the RO-Crate.
+        """
+        return chain(
+            self.default_entities, self.data_entities, self.contextual_entities
+        )
 
     def get_by_id(self, id_: str) -> List[Entity]:
         """
@@ -139,7 +187,9 @@ class ROCrate:
         Returns:
             A list of entities with the specified ID.
         """
-        return [entity for entity in self.all_entities if entity.id == id_]
+        if self._by_id is not None:
+            return self._by_id.get(id_, [])[:]
+        return [entity for entity in self._iter_entities() if entity.id == id_]
 
     def get_by_type(self, type_: Type[Entity]) -> List[Entity]:
         """
@@ -151,7 +201,9 @@ class ROCrate:
         Returns:
             A list of entities with the specified type.
         """
-        return [entity for entity in self.all_entities if type(entity) == type_]
+        if self._by_type is not None:
+            return self._by_type.get(type_, [])[:]
+        return [entity for entity in self._iter_entities() if type(entity) is type_]
 
     def get_by_id_and_type(self, id_: str, type_: Type[Entity]) -> List[Entity]:
         """
@@ -164,11 +216,43 @@ class ROCrate:
         Returns:
             A list of entities with the specified ID and type.
         """
-        return [
-            entity
-            for entity in self.all_entities
-            if entity.id == id_ and type(entity) == type_
-        ]
+        return [entity for entity in self.get_by_id(id_) if type(entity) is type_]
+
+    def get_validation_cache(self, key: str, builder: Callable[[], Any]) -> Any:
+        """
+        Get a value shared between entities during validation, building it on first access.
+
+        Entities use this to compute a value derived from the whole crate (e.g., a lookup of another entity) once per validation, instead of once per entity.
+        The value is only cached during a single validate() call, and is discarded when it returns.
+        Outside of validate() (e.g., when entity.validate(crate) is called directly), the value is built on each access.
+
+        Args:
+            key (str): The key of the value. It should be prefixed with the schema name, e.g., "amed.DMPMetadata".
+            builder (Callable[[], Any]): The function that builds the value if it is not cached.
+
+        Returns:
+            Any: The cached value.
+        """
+        if self._validation_cache is None:
+            return builder()
+        if key not in self._validation_cache:
+            self._validation_cache[key] = builder()
+        return self._validation_cache[key]
+
+    def is_url_accessible(self, url: str) -> bool:
+        """
+        Check if a URL is accessible, reusing the result checked at the start of validate() while it is running.
+
+        Args:
+            url (str): The URL to be checked.
+
+        Returns:
+            bool: True if the URL is accessible, False otherwise.
+        """
+        results: Dict[str, bool] = self.get_validation_cache("url_accessible", dict)
+        if url not in results:
+            results[url] = is_url_accessible(url)
+        return results[url]
 
     def from_jsonld(self, jsonld: Dict[str, Any]) -> None:
         """
@@ -198,6 +282,11 @@ class ROCrate:
         self.data_entities = []
         self.contextual_entities = []
 
+        use_external_ctx = DG_CONFIG["DG_USE_EXTERNAL_CTX"]
+        allow_other_gh_repo = DG_CONFIG["DG_ALLOW_OTHER_GH_REPO"]
+        # Resolve the entity class once per (context, type), as many entities usually share them.
+        entity_classes: Dict[Tuple[str, str], Any] = {}
+
         for entity in jsonld["@graph"]:
             id_ = entity.get("@id")
             if id_ is None:
@@ -216,24 +305,31 @@ class ROCrate:
                 metadata_entity = ROCrateMetadata.from_jsonld(entity)
             else:
                 ctx = entity.get("@context", RO_CRATE_CONTEXT)
-                gh_repo, gh_ref, schema = parse_ctx(ctx)
-                entity_class = None
-                if DG_CONFIG["DG_USE_EXTERNAL_CTX"]:
-                    if gh_repo != GH_REPO:
-                        if DG_CONFIG["DG_ALLOW_OTHER_GH_REPO"] is False:
-                            raise ValueError(
-                                f"The context {ctx} which is generated by {gh_repo} is not supported."
-                            )
-                    entity_class = import_external_class(gh_repo, gh_ref, schema, type_)
-                else:
-                    entity_class = import_custom_class(f"nii_dg.schema.{schema}", type_)
+                entity_class = entity_classes.get((ctx, type_))
                 if entity_class is None:
-                    raise ValueError(f"Entity type {type_} is not found.")
+                    gh_repo, gh_ref, schema = parse_ctx(ctx)
+                    if use_external_ctx:
+                        if gh_repo != GH_REPO:
+                            if allow_other_gh_repo is False:
+                                raise ValueError(
+                                    f"The context {ctx} which is generated by {gh_repo} is not supported."
+                                )
+                        entity_class = import_external_class(
+                            gh_repo, gh_ref, schema, type_
+                        )
+                    else:
+                        entity_class = import_custom_class(
+                            f"nii_dg.schema.{schema}", type_
+                        )
+                    if entity_class is None:
+                        raise ValueError(f"Entity type {type_} is not found.")
+                    entity_classes[(ctx, type_)] = entity_class
                 entity_instance = entity_class.from_jsonld(entity)
-                if isinstance(entity_instance, DataEntity):
-                    self.data_entities.append(entity_instance)
-                elif isinstance(entity_instance, ContextualEntity):
-                    self.contextual_entities.append(entity_instance)
+                category = _entity_category(type(entity_instance))  # type: ignore
+                if category is DataEntity:
+                    self.data_entities.append(entity_instance)  # type: ignore
+                elif category is ContextualEntity:
+                    self.contextual_entities.append(entity_instance)  # type: ignore
                 else:
                     raise ValueError(f"Entity type {type_} is not supported.")
 
@@ -244,6 +340,8 @@ class ROCrate:
 
         self.root = root_data_entity  # type: ignore
         self.default_entities = [self.root, metadata_entity]  # type: ignore
+        # Replace the loaded {"@id": ...} references with the live list of the loaded entities.
+        self.root["hasPart"] = self.data_entities
 
     def as_jsonld(self) -> Dict[str, Any]:
         """
@@ -257,18 +355,33 @@ class ROCrate:
 
         return {
             "@context": RO_CRATE_CONTEXT,
-            "@graph": [entity.as_jsonld() for entity in self.all_entities],
+            "@graph": [entity.as_jsonld() for entity in self._iter_entities()],
         }
 
     def dump(self, path: Union[str, Path]) -> None:
         """
         Dump the RO-Crate to a file.
 
+        The output is equivalent to json.dump(self.as_jsonld(), f, indent=2), but the entities are serialized and written one by one,
+        so the JSON-LD of the whole crate is not held in memory at once.
+        If orjson is installed, it is used for serialization, and non-ASCII characters are written as UTF-8 instead of being escaped.
+        In that case, NaN and Infinity are written as null instead of NaN and Infinity, see _dumps().
+
         Args:
             path (str): The path to the file to dump the RO-Crate to.
         """
-        with Path(path).resolve().open("w", encoding="utf-8") as f:
-            json.dump(self.as_jsonld(), f, indent=2)
+        self.check_duplicate_entity()
+        self.check_props()
+
+        with Path(path).open("wb") as f:
+            f.write(
+                b'{\n  "@context": ' + _dumps(RO_CRATE_CONTEXT) + b',\n  "@graph": ['
+            )
+            for i, entity in enumerate(self._iter_entities()):
+                f.write(b",\n    " if i > 0 else b"\n    ")
+                # JSON strings never contain raw newlines, so this only indents the lines of the entity.
+                f.write(_dumps(entity.as_jsonld()).replace(b"\n", b"\n    "))
+            f.write(b"\n  ]\n}")
 
     def check_duplicate_entity(self) -> None:
         """
@@ -283,10 +396,10 @@ class ROCrate:
         Raises:
             CrateError: If there are duplicate entities in the RO-Crate.
         """
-        id_ctx = [(entity.id, entity.context) for entity in self.all_entities]
-        dup_id_ctx = [
-            id_ctx[i] for i in range(len(id_ctx)) if id_ctx.count(id_ctx[i]) > 1
-        ]
+        id_ctx_counts = Counter(
+            (entity.id, entity.context) for entity in self._iter_entities()
+        )
+        dup_id_ctx = [id_ctx for id_ctx, count in id_ctx_counts.items() if count > 1]
         if len(dup_id_ctx) > 0:
             raise CrateError(
                 f"Duplicate entities are found in the RO-Crate: {dup_id_ctx}"
@@ -300,13 +413,11 @@ class ROCrate:
             CrateCheckPropsError: If there are errors in the properties of the entities.
         """
         crate_error = CrateCheckPropsError()
-        for entity in self.all_entities:
+        for entity in self._iter_entities():
             try:
                 entity.check_props()
             except EntityError as e:
                 crate_error.add(e)
-            except Exception as e:
-                raise e
 
         if crate_error.has_error():
             raise crate_error
@@ -319,13 +430,80 @@ class ROCrate:
             CrateValidationError: If there are errors in the entities in the RO-Crate.
         """
         crate_error = CrateValidationError()
-        for entity in self.all_entities:
-            try:
-                entity.validate(self)
-            except EntityError as e:
-                crate_error.add(e)
-            except Exception as e:
-                raise e
+        try:
+            # Index the entities for the lookups of the validators, as the entity lists are not modified during validation.
+            self._build_index()
+            # Check the URLs of all entities concurrently, as each check waits for a network response.
+            self._validation_cache = {
+                "url_accessible": are_urls_accessible(
+                    url
+                    for entity in self._iter_entities()
+                    for url in entity.urls_to_access()
+                )
+            }
+
+            for entity in self._iter_entities():
+                try:
+                    entity.validate(self)
+                except EntityError as e:
+                    crate_error.add(e)
+        finally:
+            # Do not keep the indexes and the cached values, as the crate may be modified after validation.
+            self._clear_index()
+            self._validation_cache = None
 
         if crate_error.has_error():
             raise crate_error
+
+
+@lru_cache(maxsize=None)
+def _entity_category(entity_class: Type[Entity]) -> Optional[Type[Entity]]:
+    """
+    Get which of DefaultEntity, DataEntity, and ContextualEntity the entity class inherits from.
+
+    Args:
+        entity_class (Type[Entity]): The class of the entity.
+
+    Returns:
+        Optional[Type[Entity]]: DefaultEntity, DataEntity, ContextualEntity, or None if the class inherits from none of them.
+    """
+    for category in (DefaultEntity, DataEntity, ContextualEntity):
+        if issubclass(entity_class, category):
+            return category
+    return None
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize the object to UTF-8 encoded JSON with an indent of 2, using orjson if it is installed.
+
+    If orjson cannot serialize the object (e.g., an integer exceeding the 64-bit range), json is used instead.
+    Note that orjson writes NaN and Infinity as null, whereas json writes them as NaN and Infinity, which are not valid JSON.
+
+    Args:
+        obj (Any): The object to be serialized.
+
+    Returns:
+        bytes: The serialized JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)  # type: ignore
+        except TypeError:
+            # orjson.JSONEncodeError is a subclass of TypeError
+            pass
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _remove_same_object(entities: List[Any], entity: Entity) -> None:
+    """
+    Remove the given entity object from the list, comparing by identity instead of equality.
+
+    Args:
+        entities (List[Any]): The list to remove the entity from.
+        entity (Entity): The entity to be removed.
+    """
+    for i, ent in enumerate(entities):
+        if ent is entity:
+            del entities[i]
+            return
@@ -2,14 +2,15 @@
 # coding: utf-8
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from nii_dg.check_functions import (check_entity_values, is_absolute_path,
-                                    is_iso8601, is_url, is_url_accessible)
+                                    is_iso8601, is_url)
 from nii_dg.entity import ContextualEntity, EntityDef
 from nii_dg.error import EntityError
 from nii_dg.schema.base import File as BaseFile
-from nii_dg.utils import load_schema_file, sum_file_size
+from nii_dg.utils import (group_by_referenced_entity, load_schema_file,
+                          sum_file_size)
 
 if TYPE_CHECKING:
     from nii_dg.ro_crate import ROCrate
@@ -117,8 +118,11 @@ class DMP(ContextualEntity):
         super().validate(crate)
 
         error = EntityError(self)
+        access_rights = self["accessRights"]
 
-        dmp_metadata_ents = crate.get_by_type(DMPMetadata)
+        dmp_metadata_ents = crate.get_validation_cache(
+            f"{SCHEMA_NAME}.DMPMetadata", lambda: crate.get_by_type(DMPMetadata)
+        )
         if len(dmp_metadata_ents) == 0:
             error.add(
                 "AnotherEntity",
@@ -126,31 +130,27 @@ class DMP(ContextualEntity):
             )
         else:
             dmp_metadata_ent = dmp_metadata_ents[0]
-            if "repository" not in [*self.keys(), *dmp_metadata_ent.keys()]:
+            if "repository" not in self and "repository" not in dmp_metadata_ent:
                 error.add("repository", "This property is required, but not found.")
 
-            if self[
-                "accessRights"
-            ] == "Unrestricted Open Sharing" and "distribution" not in [
-                *self.keys(),
-                *dmp_metadata_ent.keys(),
-            ]:
+            if (
+                access_rights == "Unrestricted Open Sharing"
+                and "distribution" not in self
+                and "distribution" not in dmp_metadata_ent
+            ):
                 error.add("distribution", "This property is required, but not found.")
 
-        if self["accessRights"] in [
-            "Unshared",
-            "Restricted Closed Sharing",
-        ] and not any(
-            map(
-                self.keys().__contains__, ("availabilityStarts", "reasonForConcealment")
-            )
+        if (
+            access_rights in ["Unshared", "Restricted Closed Sharing"]
+            and "availabilityStarts" not in self
+            and "reasonForConcealment" not in self
         ):
             error.add(
                 "availabilityStarts",
                 "This property is required, but not found. If the dataset remains unshared, add reasonForConcealment property instead.",
             )
 
-        if "availabilityStarts" in self and self["accessRights"] in [
+        if "availabilityStarts" in self and access_rights in [
             "Restricted Open Sharing",
             "Unrestricted Open Sharing",
         ]:
@@ -165,22 +165,24 @@ class DMP(ContextualEntity):
             )
 
         if "contentSize" in self:
-            target_files = []
-            for ent in crate.get_by_type(File):
-                if ent["dmpDataNumber"] == self:
-                    target_files.append(ent)
+            content_size = self["contentSize"]
+            files_by_dmp = crate.get_validation_cache(
+                f"{SCHEMA_NAME}.File.dmpDataNumber",
+                lambda: group_by_referenced_entity(
+                    crate.get_by_type(File), "dmpDataNumber"
+                ),
+            )
+            target_files = files_by_dmp.get(id(self), [])
 
-            sum_size = sum_file_size(self["contentSize"][-2:], target_files)
+            sum_size = sum_file_size(content_size[-2:], target_files)
 
-            if self["contentSize"] != "over100GB" and sum_size > int(
-                self["contentSize"][:-2]
-            ):
+            if content_size != "over100GB" and sum_size > int(content_size[:-2]):
                 error.add(
                     "contentSize",
                     "The total file size included in this DMP is larger than the defined size.",
                 )
 
-            if self["contentSize"] == "over100GB" and sum_size < 100:
+            if content_size == "over100GB" and sum_size < 100:
                 error.add(
                     "contentSize",
                     "The total file size included in this DMP is smaller than 100GB.",
@@ -249,12 +251,15 @@ class ClinicalResearchRegistration(ContextualEntity):
         if error.has_error():
             raise error
 
+    def urls_to_access(self) -> List[str]:
+        return [self.id]
+
     def validate(self, crate: "ROCrate") -> None:
         super().validate(crate)
 
         error = EntityError(self)
 
-        if not is_url_accessible(self.id):
+        if not crate.is_url_accessible(self.id):
             error.add("@id", "The URL is not accessible.")
 
         if error.has_error():
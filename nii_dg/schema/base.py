@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 # coding: utf-8
 
+import json
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping
 from urllib.request import urlopen
 
-from nii_dg.check_functions import (check_entity_values, is_absolute_path,
-                                    is_content_size, is_email,
-                                    is_encoding_format, is_iso8601, is_orcid,
-                                    is_phone_number, is_relative_path,
-                                    is_sha256, is_url, is_url_accessible)
+from nii_dg.check_functions import (URL_ACCESS_TIMEOUT, check_entity_values,
+                                    is_absolute_path, is_content_size,
+                                    is_email, is_encoding_format, is_iso8601,
+                                    is_orcid, is_phone_number,
+                                    is_relative_path, is_sha256, is_url)
 from nii_dg.entity import ContextualEntity, DataEntity, EntityDef
 from nii_dg.error import EntityError
 from nii_dg.utils import load_schema_file
@@ -22,6 +24,18 @@ SCHEMA_NAME = Path(__file__).stem
 SCHEMA_FILE_PATH = Path(__file__).resolve().parent.joinpath(f"{SCHEMA_NAME}.yml")
 SCHEMA_DEF = load_schema_file(SCHEMA_FILE_PATH)
 
+# File entities are usually the most numerous, so build their check rules once.
+# Read-only, as they are shared by File and its subclasses in the other schemas.
+FILE_CHECK_RULES: Mapping[str, Callable[[Any], bool]] = MappingProxyType(
+    {
+        "contentSize": is_content_size,
+        "encodingFormat": is_encoding_format,
+        "sha256": is_sha256,
+        "url": is_url,
+        "sdDatePublished": is_iso8601,
+    }
+)
+
 
 class File(DataEntity):
     def __init__(
@@ -36,16 +50,7 @@ class File(DataEntity):
     def check_props(self) -> None:
         super().check_props()
 
-        error = check_entity_values(
-            self,
-            {
-                "contentSize": is_content_size,
-                "encodingFormat": is_encoding_format,
-                "sha256": is_sha256,
-                "url": is_url,
-                "sdDatePublished": is_iso8601,
-            },
-        )
+        error = check_entity_values(self, FILE_CHECK_RULES)
         if is_absolute_path(self.id):
             error.add("@id", "The id MUST be a URL or a relative path.")
 
@@ -128,13 +133,20 @@ class Organization(ContextualEntity):
         Raises:
             urllib.error.HTTPError: If the ROR API returns an error.
         """
-        with urlopen(f"https://api.ror.org/organizations/{ror_id}") as res:
-            json = res.read().decode("utf-8")
-            name_list = [json["name"]]
-            name_list.extend(json["aliases"])
+        with urlopen(
+            f"https://api.ror.org/organizations/{ror_id}", timeout=URL_ACCESS_TIMEOUT
+        ) as res:
+            org = json.loads(res.read().decode("utf-8"))
+            name_list = [org["name"]]
+            name_list.extend(org["aliases"])
 
         return name_list
 
+    def urls_to_access(self) -> List[str]:
+        if self.id.startswith("https://ror.org/"):
+            return []
+        return [self.id]
+
     def validate(self, crate: "ROCrate") -> None:
         super().validate(crate)
 
@@ -148,7 +160,7 @@ class Organization(ContextualEntity):
                     "name", f"The name MUST be one of {name_list} registered in ROR."
                 )
         else:
-            if not is_url_accessible(self.id):
+            if not crate.is_url_accessible(self.id):
                 error.add("@id", "Failed to access the URL.")
 
         if error.has_error():
@@ -183,12 +195,15 @@ class Person(ContextualEntity):
         if error.has_error():
             raise error
 
+    def urls_to_access(self) -> List[str]:
+        return [self.id]
+
     def validate(self, crate: "ROCrate") -> None:
         super().validate(crate)
 
         error = EntityError(self)
 
-        if not is_url_accessible(self.id):
+        if not crate.is_url_accessible(self.id):
             error.add("@id", "Failed to access the URL.")
 
         if error.has_error():
@@ -218,12 +233,15 @@ class License(ContextualEntity):
         if error.has_error():
             raise error
 
+    def urls_to_access(self) -> List[str]:
+        return [self.id]
+
     def validate(self, crate: "ROCrate") -> None:
         super().validate(crate)
 
         error = EntityError(self)
 
-        if not is_url_accessible(self.id):
+        if not crate.is_url_accessible(self.id):
             error.add("@id", "Failed to access the URL.")
 
         if error.has_error():
@@ -279,12 +297,15 @@ class DataDownload(ContextualEntity):
         if error.has_error():
             raise error
 
+    def urls_to_access(self) -> List[str]:
+        return [self.id]
+
     def validate(self, crate: "ROCrate") -> None:
         super().validate(crate)
 
         error = EntityError(self)
 
-        if not is_url_accessible(self.id):
+        if not crate.is_url_accessible(self.id):
             error.add("@id", "Failed to access the URL.")
 
         if error.has_error():
@@ -343,9 +364,10 @@ class ContactPoint(ContextualEntity):
 
         if self.id.startswith("#mailto:"):
             email = self.id.replace("#mailto:", "")
-            if self.get("email") is None:
+            email_prop = self.get("email")
+            if email_prop is None:
                 error.add("email", "This property is required.")
-            elif self.get("email") != email:
+            elif email_prop != email:
                 error.add(
                     "@id",
                     "The email address MUST be the same as the value of the email property.",
@@ -356,9 +378,10 @@ class ContactPoint(ContextualEntity):
                 )
         elif self.id.startswith("#callto:"):
             phone_number = self.id.replace("#callto:", "")
-            if self.get("telephone") is None:
+            telephone_prop = self.get("telephone")
+            if telephone_prop is None:
                 error.add("telephone", "This property is required.")
-            elif self.get("telephone") != phone_number:
+            elif telephone_prop != phone_number:
                 error.add(
                     "@id",
                     "The phone number MUST be the same as the value of the telephone property.",
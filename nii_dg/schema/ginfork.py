@@ -2,7 +2,7 @@
 # coding: utf-8
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from nii_dg.check_functions import is_absolute_path, is_url
 from nii_dg.entity import ContextualEntity, EntityDef
@@ -59,19 +59,23 @@ class GinMonitoring(ContextualEntity):
             for ent in crate.get_by_type(File)
             if ent["experimentPackageFlag"] is True
         ]
-        sum_size = sum_file_size(self["contentSize"][-2:], targets)
-        if sum_size > int(self["contentSize"][:-2]):
+        content_size = self["contentSize"]
+        sum_size = sum_file_size(content_size[-2:], targets)
+        if sum_size > int(content_size[:-2]):
             error.add(
                 "contentSize",
                 "The total file size of ginfork.File labeled as an experimental package is larger than the defined size.",
             )
 
-        dir_paths = [Path(dir_.id) for dir_ in crate.get_by_type(Dataset)]
-        required_dirs = [
-            Path(experiment_dir).joinpath(required_dir_name)
-            for experiment_dir in self["experimentPackageList"]
-            for required_dir_name in REQUIRED_DIRECTORIES[self["datasetStructure"]]
-        ]
+        dir_paths = frozenset(Path(dir_.id) for dir_ in crate.get_by_type(Dataset))
+        required_dir_names = REQUIRED_DIRECTORIES[self["datasetStructure"]]
+        required_dirs: List[Path] = []
+        for experiment_dir in self["experimentPackageList"]:
+            experiment_path = Path(experiment_dir)
+            required_dirs.extend(
+                experiment_path.joinpath(required_dir_name)
+                for required_dir_name in required_dir_names
+            )
         missing_dirs = [
             dir_path for dir_path in required_dirs if dir_path not in dir_paths
         ]
@@ -88,11 +92,13 @@ class GinMonitoring(ContextualEntity):
                     "This property is required, but not found.",
                 )
             else:
-                param_dirs = [
-                    Path(param_dir).joinpath(required_dir_name)
-                    for param_dir in self["parameterExperimentList"]
-                    for required_dir_name in ["output_data", "params"]
-                ]
+                param_dirs: List[Path] = []
+                for param_dir in self["parameterExperimentList"]:
+                    param_path = Path(param_dir)
+                    param_dirs.extend(
+                        param_path.joinpath(required_dir_name)
+                        for required_dir_name in ("output_data", "params")
+                    )
                 missing_dirs = [
                     param_dir for param_dir in param_dirs if param_dir not in dir_paths
                 ]
@@ -9,7 +9,8 @@ from nii_dg.check_functions import (check_entity_values, is_absolute_path,
 from nii_dg.entity import ContextualEntity, EntityDef
 from nii_dg.error import EntityError
 from nii_dg.schema.base import File as BaseFile
-from nii_dg.utils import load_schema_file, sum_file_size
+from nii_dg.utils import (group_by_referenced_entity, load_schema_file,
+                          sum_file_size)
 
 if TYPE_CHECKING:
     from nii_dg.ro_crate import ROCrate
@@ -55,11 +56,10 @@ class DMPMetadata(ContextualEntity):
                 "about",
                 "The value of this property MUST be the RootDataEntity of this crate.",
             )
-        if len(self["hasPart"]) != len(crate.get_by_type(DMP)):
-            diff = []
-            for dmp in crate.get_by_type(DMP):
-                if dmp not in self["hasPart"]:
-                    diff.append(dmp)
+        dmp_ents = crate.get_by_type(DMP)
+        if len(self["hasPart"]) != len(dmp_ents):
+            has_part_ids = {id(ent) for ent in self["hasPart"]}
+            diff = [dmp for dmp in dmp_ents if id(dmp) not in has_part_ids]
             error.add(
                 "hasPart", f"There is an omission of DMP entity in the list: {diff}."
             )
@@ -98,8 +98,11 @@ class DMP(ContextualEntity):
         super().validate(crate)
 
         error = EntityError(self)
+        access_rights = self["accessRights"]
 
-        dmp_metadata_ents = crate.get_by_type(DMPMetadata)
+        dmp_metadata_ents = crate.get_validation_cache(
+            f"{SCHEMA_NAME}.DMPMetadata", lambda: crate.get_by_type(DMPMetadata)
+        )
         if len(dmp_metadata_ents) == 0:
             error.add(
                 "AnotherEntity",
@@ -107,37 +110,36 @@ class DMP(ContextualEntity):
             )
         else:
             dmp_metadata_ent = dmp_metadata_ents[0]
-            if "repository" not in list(self.keys()) + list(dmp_metadata_ent.keys()):
+            if "repository" not in self and "repository" not in dmp_metadata_ent:
                 error.add("repository", "This property is required, but not found.")
 
-            if self["accessRights"] == "open access" and "distribution" not in list(
-                self.keys()
-            ) + list(dmp_metadata_ent.keys()):
+            if (
+                access_rights == "open access"
+                and "distribution" not in self
+                and "distribution" not in dmp_metadata_ent
+            ):
                 error.add("distribution", "This property is required, but not found.")
 
-        if self["accessRights"] != "open access" and "reasonForConcealment" not in self:
+        if access_rights != "open access" and "reasonForConcealment" not in self:
             error.add(
                 "reasonForConcealment", "This property is required, but not found."
             )
 
-        if (
-            self["accessRights"] == "embargoed access"
-            and "availabilityStarts" not in self
-        ):
+        if access_rights == "embargoed access" and "availabilityStarts" not in self:
             error.add("availabilityStarts", "This property is required, but not found.")
 
-        if self["accessRights"] != "embargoed access" and "availabilityStarts" in self:
+        if access_rights != "embargoed access" and "availabilityStarts" in self:
             error.add("availabilityStarts", "This property is not required.")
 
         if (
-            self["accessRights"] in ["open access", "restricted access"]
+            access_rights in ["open access", "restricted access"]
             and "isAccessibleForFree" not in self
         ):
             error.add(
                 "isAccessibleForFree", "This property is required, but not found."
             )
 
-        if self["accessRights"] == "open access":
+        if access_rights == "open access":
             if "isAccessibleForFree" in self and self["isAccessibleForFree"] is False:
                 error.add("isAccessibleForFree", "The value MUST be True.")
             if "license" not in self:
@@ -146,29 +148,30 @@ class DMP(ContextualEntity):
                 error.add("contentSize", "This property is required, but not found.")
 
         if (
-            self["accessRights"]
-            in ["open access", "restricted access", "embargoed access"]
+            access_rights in ["open access", "restricted access", "embargoed access"]
             and "contactPoint" not in self
         ):
             error.add("contactPoint", "This property is required, but not found.")
 
         if "contentSize" in self:
-            target_files = []
-            for ent in crate.get_by_type(File):
-                if ent["dmpDataNumber"] == self:
-                    target_files.append(ent)
+            content_size = self["contentSize"]
+            files_by_dmp = crate.get_validation_cache(
+                f"{SCHEMA_NAME}.File.dmpDataNumber",
+                lambda: group_by_referenced_entity(
+                    crate.get_by_type(File), "dmpDataNumber"
+                ),
+            )
+            target_files = files_by_dmp.get(id(self), [])
 
-            sum_size = sum_file_size(self["contentSize"][-2:], target_files)
+            sum_size = sum_file_size(content_size[-2:], target_files)
 
-            if self["contentSize"] != "over100GB" and sum_size > int(
-                self["contentSize"][:-2]
-            ):
+            if content_size != "over100GB" and sum_size > int(content_size[:-2]):
                 error.add(
                     "contentSize",
                     "The total file size included in this DMP is larger than the defined size.",
                 )
 
-            if self["contentSize"] == "over100GB" and sum_size < 100:
+            if content_size == "over100GB" and sum_size < 100:
                 error.add(
                     "contentSize",
                     "The total file size included in this DMP is smaller than 100GB.",
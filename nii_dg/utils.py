@@ -12,6 +12,7 @@ import os
 import re
 import tempfile
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import (TYPE_CHECKING, Any, Dict, List, Literal, NewType, Optional,
                     Tuple, TypedDict, Union, get_args, get_origin)
@@ -23,6 +24,12 @@ import yaml
 from nii_dg.const import RO_CRATE_CONTEXT
 from nii_dg.module_info import GH_REF, GH_REPO
 
+try:
+    # Use the LibYAML based loader if available, as it parses much faster.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 if TYPE_CHECKING:
     from nii_dg.entity import Entity
 
@@ -68,6 +75,7 @@ def load_config() -> Dict[str, Any]:
 DG_CONFIG = load_config()
 
 
+@lru_cache(maxsize=None)
 def generate_ctx(
     gh_repo: str = GH_REPO, gh_ref: str = GH_REF, schema_name: str = "ro-crate"
 ) -> str:
@@ -94,6 +102,13 @@ def generate_ctx(
     )
 
 
+CTX_PATTERN = re.compile(
+    r"https://raw\.githubusercontent\.com/(?P<gh_repo>[^/]+/[^/]+)/(?P<gh_ref>[^/]+)/schema/context/(?P<schema>[^/]+)\.jsonld"
+)
+
+
+# Bounded, as the contexts come from API requests
+@lru_cache(maxsize=128)
 def parse_ctx(ctx: str) -> Tuple[str, str, str]:
     """
     Parse the given context string and return a tuple of (gh_repo, gh_ref, schema_name).
@@ -110,8 +125,7 @@ def parse_ctx(ctx: str) -> Tuple[str, str, str]:
     if ctx == RO_CRATE_CONTEXT:
         return GH_REPO, GH_REF, "ro-crate"
 
-    pattern = r"https://raw\.githubusercontent\.com/(?P<gh_repo>[^/]+/[^/]+)/(?P<gh_ref>[^/]+)/schema/context/(?P<schema>[^/]+)\.jsonld"
-    match = re.match(pattern, ctx)
+    match = CTX_PATTERN.match(ctx)
 
     if match:
         gh_repo = match.group("gh_repo")
@@ -144,6 +158,7 @@ SchemaDef = NewType("SchemaDef", Dict[str, EntityDef])
 # ==================================
 
 
+@lru_cache(maxsize=None)
 def load_schema_file(schema_path: Path) -> SchemaDef:
     """
     Load a schema file and return a SchemaDef object.
@@ -152,17 +167,21 @@ def load_schema_file(schema_path: Path) -> SchemaDef:
         schema_path (Path): The path to the schema file.
 
     Returns:
-        SchemaDef: The schema definition.
+        SchemaDef: The schema definition. It is shared between callers and MUST NOT be modified.
 
     Raises:
         FileNotFoundError: If the schema file is not found.
     """
-    if not schema_path.exists():
-        raise FileNotFoundError(f"Schema file not found: {schema_path}")
-    with schema_path.open(mode="r", encoding="utf-8") as f:
-        return yaml.safe_load(f)  # type: ignore
+    # Open the file directly instead of checking exists() first, which costs another stat
+    try:
+        with schema_path.open(mode="r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=SafeLoader)  # type: ignore
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema file not found: {schema_path}") from None
 
 
+# Bounded, as the class names come from API requests, including unknown ones
+@lru_cache(maxsize=128)
 def import_custom_class(module_name: str, class_name: str) -> Any:
     """
     Import a custom class from a module.
@@ -269,85 +288,100 @@ def import_external_class(
         return None
 
 
-def is_instance_of_expected_type(value: Any, expected_type: str) -> bool:
+# The type names that can be used in expected_type, other than the Entity classes
+TYPE_NAME_TABLE: Dict[str, Any] = {
+    "List": List,
+    "Dict": Dict,
+    "Tuple": Tuple,
+    "Union": Union,
+    "Optional": Optional,
+    "Literal": Literal,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+}
+
+
+@lru_cache(maxsize=None)
+def parse_type_string(type_str: str) -> Any:
     """
-    Check if a given value is an instance of a given expected type.
+    Parse a type string and return the corresponding type object.
 
     Args:
-        value (Any): The value to be checked.
-        expected_type (str): The expected type.
+        type_str (str): The type string to be parsed.
 
     Returns:
-        bool: True if the given value is an instance of the given expected type, False otherwise.
-    """
+        Any: The type object corresponding to the given type string. e.g., "List[int]" -> typing.List[int]
 
-    def parse_type_string(type_str: str) -> Any:
-        """
-        Parse a type string and return the corresponding type object.
+    Notes:
+        ast.parse returns a ast.Module object as follows:
 
-        Args:
-            type_str (str): The type string to be parsed.
+        "List[int]" ->
+            Subscript(value=Name(id='List', ctx=Load()), slice=Index(value=Name(id='int', ctx=Load())), ctx=Load())
+        "Dict[str, int]" ->
+            Subscript(value=Name(id='Dict', ctx=Load()), slice=Index(value=Tuple(
+                elts=[Name(id='str', ctx=Load()), Name(id='int', ctx=Load())], ctx=Load())), ctx=Load())
+        "str" -> Name(id='str', ctx=Load())
+        "List" -> Name(id='List', ctx=Load())
+        "Entity" -> Name(id='Entity', ctx=Load())
 
-        Returns:
-            Any: The type object corresponding to the given type string. e.g., "List[int]" -> typing.List[int]
+        ---
 
-        Notes:
-            ast.parse returns a ast.Module object as follows:
+        Optional[str] -> Union[str, NoneType]
+    """
+    type_node = ast.parse(type_str).body[0].value  # type: ignore
+    return ast_to_type(type_node)
 
-            "List[int]" ->
-                Subscript(value=Name(id='List', ctx=Load()), slice=Index(value=Name(id='int', ctx=Load())), ctx=Load())
-            "Dict[str, int]" ->
-                Subscript(value=Name(id='Dict', ctx=Load()), slice=Index(value=Tuple(
-                    elts=[Name(id='str', ctx=Load()), Name(id='int', ctx=Load())], ctx=Load())), ctx=Load())
-            "str" -> Name(id='str', ctx=Load())
-            "List" -> Name(id='List', ctx=Load())
-            "Entity" -> Name(id='Entity', ctx=Load())
 
-            ---
+def ast_to_type(node: ast.AST) -> Any:
+    """
+    Convert an AST node to a type object.
 
-            Optional[str] -> Union[str, NoneType]
-        """
-        type_node = ast.parse(type_str).body[0].value  # type: ignore
-        return ast_to_type(type_node)
+    Args:
+        node (ast.AST): The AST node to be converted.
 
-    def ast_to_type(node: ast.AST) -> Any:
-        """
-        Convert an AST node to a type object.
+    Returns:
+        Any: The type object corresponding to the given AST node.
+    """
+    if isinstance(node, ast.Name):
+        if node.id in TYPE_NAME_TABLE:
+            return TYPE_NAME_TABLE[node.id]
+        custom_class = import_custom_class("nii_dg.entity", node.id)
+        if custom_class is None:
+            return Any
+        return custom_class
+    elif isinstance(node, ast.Subscript):
+        origin = ast_to_type(node.value)  # e.g., typing.List
+        args = []
+        if isinstance(node.slice, ast.Index):  # use for python3.8
+            slice_value = node.slice.value  # type: ignore
+        else:  # use for python3.9 and later
+            slice_value = node.slice  # type: ignore
+        if isinstance(slice_value, ast.Tuple):
+            args = [ast_to_type(arg) for arg in slice_value.elts]
+        else:
+            args.append(ast_to_type(slice_value))
 
-        Args:
-            node (ast.AST): The AST node to be converted.
+        return origin[tuple(args) if len(args) > 1 else args[0]]
+    elif isinstance(node, ast.Constant):
+        # for Literal
+        return node.value
+    else:
+        return Any
 
-        Returns:
-            Any: The type object corresponding to the given AST node.
-        """
-        if isinstance(node, ast.Name):
-            if node.id in ("List", "Dict", "Tuple", "Union", "Optional", "Literal"):
-                return getattr(importlib.import_module("typing"), node.id)
-            elif node.id in ("str", "int", "float", "bool"):
-                return eval(node.id)
-            else:
-                custom_class = import_custom_class("nii_dg.entity", node.id)
-                if custom_class is None:
-                    return Any
-                return custom_class
-        elif isinstance(node, ast.Subscript):
-            origin = ast_to_type(node.value)  # e.g., typing.List
-            args = []
-            if isinstance(node.slice, ast.Index):  # use for python3.8
-                slice_value = node.slice.value  # type: ignore
-            else:  # use for python3.9 and later
-                slice_value = node.slice  # type: ignore
-            if isinstance(slice_value, ast.Tuple):
-                args = [ast_to_type(arg) for arg in slice_value.elts]
-            else:
-                args.append(ast_to_type(slice_value))
 
-            return origin[tuple(args) if len(args) > 1 else args[0]]
-        elif isinstance(node, ast.Constant):
-            # for Literal
-            return node.value
-        else:
-            return Any
+def is_instance_of_expected_type(value: Any, expected_type: str) -> bool:
+    """
+    Check if a given value is an instance of a given expected type.
+
+    Args:
+        value (Any): The value to be checked.
+        expected_type (str): The expected type.
+
+    Returns:
+        bool: True if the given value is an instance of the given expected type, False otherwise.
+    """
 
     def check_type(value: Any, expected_type: Any) -> bool:
         """
@@ -402,8 +436,9 @@ def is_instance_of_expected_type(value: Any, expected_type: str) -> bool:
                 return True
 
             # Check if value is an instance of expected_type or its subclasses
+            expected_type_name = expected_type.__name__
             for cls in value.__class__.__mro__:
-                if cls.__name__ == expected_type.__name__:
+                if cls.__name__ == expected_type_name:
                     return True
 
             return isinstance(value, expected_type)
@@ -414,6 +449,9 @@ def is_instance_of_expected_type(value: Any, expected_type: str) -> bool:
     return check_type(value, parsed_expected_type)
 
 
+SEMANTIC_VERSION_PATTERN = re.compile(r"\d+\.\d+\.\d+")
+
+
 def is_semantic_version(version: str) -> bool:
     """
     Check if a given string is a semantic version.
@@ -424,7 +462,7 @@ def is_semantic_version(version: str) -> bool:
     Returns:
         bool: True if the given string is a semantic version, False otherwise.
     """
-    return re.fullmatch(r"\d+\.\d+\.\d+", version) is not None
+    return SEMANTIC_VERSION_PATTERN.fullmatch(version) is not None
 
 
 def is_version_newer(ver1: str, ver2: str) -> bool:
@@ -455,6 +493,65 @@ def is_version_newer(ver1: str, ver2: str) -> bool:
     return False
 
 
+def group_by_referenced_entity(
+    entities: List["Entity"], prop: str
+) -> Dict[int, List["Entity"]]:
+    """
+    Group the entities by the entity object referenced in the given property, e.g., File entities by their DMP entity.
+
+    Args:
+        entities (List[Entity]): The entities to be grouped.
+        prop (str): The name of the property that refers to another entity, e.g., "dmpDataNumber".
+
+    Returns:
+        Dict[int, List[Entity]]: The entities grouped by id() of the referenced entity object.
+        Entities whose property is not an Entity object (e.g., a {"@id": ...} dictionary) are not included.
+
+    Raises:
+        KeyError: If an entity does not have the property.
+    """
+    from nii_dg.entity import Entity
+
+    groups: Dict[int, List["Entity"]] = {}
+    for entity in entities:
+        referenced = entity[prop]
+        if isinstance(referenced, Entity):
+            groups.setdefault(id(referenced), []).append(entity)
+
+    return groups
+
+
+SIZE_UNIT_CONVERSION_TABLE = {
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+    "PB": 1024**5,
+}
+CONTENT_SIZE_PARSE_PATTERN = re.compile(r"^(?P<size>\d+)(?P<unit>[KMGTP]?B)$")
+
+
+def content_size_to_bytes(content_size: str) -> int:
+    """
+    Convert a content size string to the number of bytes.
+
+    Args:
+        content_size (str): The content size, e.g., "500MB".
+
+    Returns:
+        int: The content size in bytes.
+
+    Raises:
+        ValueError: If the content size is not a valid format.
+    """
+    match = CONTENT_SIZE_PARSE_PATTERN.match(content_size)
+    if match is None:
+        raise ValueError(f"Invalid content size: {content_size}")
+
+    return int(match.group("size")) * SIZE_UNIT_CONVERSION_TABLE[match.group("unit")]
+
+
 def sum_file_size(size_unit: str, entities: List["Entity"]) -> float:
     """
     Sum the file sizes of the given entities and convert the result to the specified unit.
@@ -466,27 +563,14 @@ def sum_file_size(size_unit: str, entities: List["Entity"]) -> float:
     Returns:
         float: The sum of the file sizes of the given entities in the specified unit.
     """
-    unit_conversion_table = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4,
-        "PB": 1024**5,
-    }
-    if size_unit not in unit_conversion_table:
+    if size_unit not in SIZE_UNIT_CONVERSION_TABLE:
         raise ValueError(f"Invalid size unit: {size_unit}")
 
     total_size = 0
     for entity in entities:
         if "contentSize" not in entity:
             raise ValueError(f"contentSize is not defined for {entity}")
-        match = re.match(r"^(?P<size>\d+)(?P<unit>[KMGTP]?B)$", entity["contentSize"])
-        if match is None:
-            raise ValueError(f"Invalid content size: {entity['contentSize']}")
-        size = int(match.group("size"))
-        unit = match.group("unit")
-        total_size += size * unit_conversion_table[unit]
+        total_size += content_size_to_bytes(entity["contentSize"])
 
     # round to 2 decimal places
-    return round(total_size / unit_conversion_table[size_unit], 3)
+    return round(total_size / SIZE_UNIT_CONVERSION_TABLE[size_unit], 3)
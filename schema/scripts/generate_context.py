@@ -22,6 +22,11 @@ import yaml
 
 from nii_dg.module_info import GH_REF, GH_REPO
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 Prop = TypedDict(
     "Prop",
     {
@@ -80,12 +85,11 @@ def main(args: List[str]) -> None:
         if not schema_file.exists():
             raise Exception(f"Schema file {schema_file} does not exist")
         with schema_file.open("r", encoding="utf-8") as f:
-            schema = yaml.safe_load(f)
+            schema = yaml.load(f, Loader=SafeLoader)
         schema_name = schema_file.stem
         ctx = generate_ctx(schema, GH_REPO, GH_REF, schema_name)
         ctx_file_dst: Path = parsed_args.ctx_file_dst.resolve()
-        with ctx_file_dst.open("w", encoding="utf-8") as f:
-            f.write(ctx)
+        ctx_file_dst.write_text(ctx, encoding="utf-8")
 
     except Exception as e:
         print(e)
@@ -7,6 +7,11 @@ from typing import Dict, List, TypedDict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 Prop = TypedDict("Prop", {"description": str, "example": str, "expected_type": str})
 prop_keys = set(Prop.__annotations__.keys())
 Entity = Dict[str, Prop]
@@ -42,25 +47,29 @@ def main(args: List[str]) -> None:
         if not schema_file.exists():
             raise Exception(f"Schema file {schema_file} does not exist")
         with schema_file.open("r", encoding="utf-8") as f:
-            schema = yaml.safe_load(f)
+            schema = yaml.load(f, Loader=SafeLoader)
         schema_name = schema_file.stem
-        docs = TEMPLATE_DOCS.format(schema_name=schema_name, repo=REPO_NAME)
+        # Collect the fragments and join them once, instead of concatenating strings
+        docs = [TEMPLATE_DOCS.format(schema_name=schema_name, repo=REPO_NAME)]
         for entity_name, entity in schema.items():
-            docs += TEMPLATE_ENTITY.format(
-                entity_name=entity_name, description=entity["description"]
+            docs.append(
+                TEMPLATE_ENTITY.format(
+                    entity_name=entity_name, description=entity["description"]
+                )
             )
             for prop_name, prop in entity["props"].items():
-                docs += TEMPLATE_PROP.format(
-                    prop_name=prop_name,
-                    expected_type=prop["expected_type"],
-                    required=prop["required"],
-                    description=prop["description"],
-                    example=prop["example"],
+                docs.append(
+                    TEMPLATE_PROP.format(
+                        prop_name=prop_name,
+                        expected_type=prop["expected_type"],
+                        required=prop["required"],
+                        description=prop["description"],
+                        example=prop["example"],
+                    )
                 )
-            docs += "\n"
+            docs.append("\n")
 
-        with dst.open("w", encoding="utf-8") as f:
-            f.write(docs.strip() + "\n")
+        dst.write_text("".join(docs).strip() + "\n", encoding="utf-8")
 
     except Exception as e:
         print(e)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # coding: utf-8
 
+import json
 import sys
 import traceback
 from pathlib import Path
@@ -8,6 +9,11 @@ from typing import Any, Dict, List, TypedDict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 Prop = TypedDict(
     "Prop",
     {
@@ -54,7 +60,10 @@ def validate_and_format(schema_name: str, schema: Any) -> Schema:
             formatted_prop = {}
             for expected_key in prop_keys:
                 prop_val = prop.get(expected_key, "")
-                if not isinstance(prop_val, str):
+                if isinstance(prop_val, (dict, list)):
+                    # Serialize nested examples as JSON instead of patching the quotes of repr()
+                    prop_val = json.dumps(prop_val, ensure_ascii=False, default=str)
+                elif not isinstance(prop_val, str):
                     prop_val = str(prop_val).replace("'", '"')
                 formatted_prop[expected_key] = " ".join(prop_val.strip().split("\n"))
             formatted_props[prop_name] = formatted_prop
@@ -78,18 +87,18 @@ def main(args: List[str]) -> None:
         if not schema_file.exists():
             raise ValidateError(f"Schema file {schema_file} does not exist")
         with schema_file.open("r", encoding="utf-8") as f:
-            schema = yaml.safe_load(f)
+            schema = yaml.load(f, Loader=SafeLoader)
         schema_name = schema_file.stem
         formatted_schema = validate_and_format(schema_name, schema)
-        with dst.open("w", encoding="utf-8") as f:
-            f.write(
-                yaml.dump(
-                    formatted_schema,
-                    width=1000,
-                    indent=2,
-                    sort_keys=False,
-                )
-            )
+        dst.write_text(
+            yaml.dump(
+                formatted_schema,
+                width=1000,
+                indent=2,
+                sort_keys=False,
+            ),
+            encoding="utf-8",
+        )
 
     except ValidateError as e:
         print(e)
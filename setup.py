@@ -35,6 +35,9 @@ setup(
         "waitress",
     ],
     extras_require={
+        "orjson": [
+            "orjson",
+        ],
         "tests": [
             "coverage",
             "flake8",
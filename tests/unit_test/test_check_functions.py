@@ -1,6 +1,13 @@
 #!/usr/bin/env python3
 # coding: utf-8
 
+from typing import Any
+from urllib.error import HTTPError
+from urllib.request import Request
+
+import pytest
+
+import nii_dg.check_functions
 from nii_dg.check_functions import (is_absolute_path, is_content_size,
                                     is_email, is_encoding_format, is_iso8601,
                                     is_orcid, is_phone_number,
@@ -33,6 +40,12 @@ def test_is_sha256() -> None:
     assert not is_sha256(
         "1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdefg"
     )
+    assert not is_sha256(
+        "1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdeg"
+    )
+    assert not is_sha256(
+        "1234567890abcdef 1234567890abcdef1234567890abcdef1234567890abcde"
+    )
 
 
 def test_is_url() -> None:
@@ -102,3 +115,27 @@ def test_is_url_accessible() -> None:
     assert is_url_accessible("https://www.example.com")
 
     assert not is_url_accessible("https://github.com/NII-DG/nii-dg/404")
+
+
+def test_is_url_accessible_falls_back_to_get(monkeypatch: pytest.MonkeyPatch) -> None:
+    methods = []
+
+    class FakeResponse:
+        status = 200
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, *args: Any) -> None:
+            pass
+
+    def fake_urlopen(req: Request, timeout: float) -> FakeResponse:
+        methods.append(req.get_method())
+        if req.get_method() == "HEAD":
+            raise HTTPError(req.full_url, 405, "Method Not Allowed", None, None)  # type: ignore
+        return FakeResponse()
+
+    monkeypatch.setattr(nii_dg.check_functions, "urlopen", fake_urlopen)
+
+    assert is_url_accessible("https://example.com/head-not-allowed")
+    assert methods == ["HEAD", "GET"]
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import json
+from pathlib import Path
+
+import pytest
+
+import nii_dg.check_functions
+import nii_dg.ro_crate
+from nii_dg.error import CrateError
+from nii_dg.ro_crate import ROCrate
+from nii_dg.schema.base import File, License, Person
+from nii_dg.schema.meti import DMP
+
+
+def test_check_duplicate_entity() -> None:
+    crate = ROCrate()
+    crate.add(File("file.txt"), Person("https://example.com/person"))
+    crate.check_duplicate_entity()
+
+    crate.add(File("file.txt"))
+    with pytest.raises(CrateError) as e:
+        crate.check_duplicate_entity()
+    assert "file.txt" in str(e.value)
+    assert "https://example.com/person" not in str(e.value)
+
+
+def test_check_duplicate_entity_after_remove() -> None:
+    crate = ROCrate()
+    file = File("removed.txt")
+    crate.add(file)
+    crate.remove(file)
+
+    crate.add(File("file.txt"), File("file.txt"))
+    with pytest.raises(CrateError):
+        crate.check_duplicate_entity()
+
+
+def test_check_duplicate_entity_after_list_modification() -> None:
+    crate = ROCrate()
+    file = File("file.txt")
+    crate.add(file, File("dup.txt"), File("dup.txt"))
+    # modify the public entity list directly, instead of using remove()
+    crate.data_entities.remove(file)
+
+    with pytest.raises(CrateError) as e:
+        crate.check_duplicate_entity()
+    assert "dup.txt" in str(e.value)
+
+
+def test_remove() -> None:
+    crate = ROCrate()
+    file = File("file.txt")
+    crate.add(file)
+
+    with pytest.raises(ValueError):
+        # equal to the added entity, but not the same object
+        crate.remove(File("file.txt"))
+
+    crate.remove(file)
+    assert crate.data_entities == []
+    with pytest.raises(ValueError):
+        crate.remove(file)
+    with pytest.raises(ValueError):
+        crate.remove(crate.root)
+
+
+def test_remove_after_list_modification() -> None:
+    crate = ROCrate()
+    appended_file = File("appended.txt")
+    # modify the public entity lists directly, instead of using add() and remove()
+    crate.root["hasPart"].append(appended_file)
+    crate.remove(appended_file)
+    assert crate.data_entities == []
+
+    removed_file = File("removed.txt")
+    crate.add(removed_file)
+    crate.data_entities.remove(removed_file)
+    with pytest.raises(ValueError):
+        crate.remove(removed_file)
+
+
+def test_get_by_id_and_type() -> None:
+    crate = ROCrate()
+    file = File("file.txt")
+    person_with_same_id = Person("file.txt")
+    person = Person("https://example.com/person")
+    crate.add(file, person_with_same_id, person)
+
+    assert crate.get_by_id("./") == [crate.root]
+    assert crate.get_by_id("file.txt") == [file, person_with_same_id]
+    assert crate.get_by_id("unknown") == []
+    assert crate.get_by_type(File) == [file]
+    assert crate.get_by_type(Person) == [person_with_same_id, person]
+    assert crate.get_by_id_and_type("file.txt", Person) == [person_with_same_id]
+
+    crate.remove(person_with_same_id)
+    assert crate.get_by_id("file.txt") == [file]
+    assert crate.get_by_type(Person) == [person]
+
+    # entities added to the public entity lists directly are also found
+    appended_file = File("appended.txt")
+    crate.root["hasPart"].append(appended_file)
+    assert crate.get_by_id("appended.txt") == [appended_file]
+    assert crate.get_by_type(File) == [file, appended_file]
+
+    # returned lists are copies
+    crate.get_by_type(File).clear()
+    assert crate.get_by_type(File) == [file, appended_file]
+
+
+def test_validate_uses_current_entity_lists(monkeypatch: pytest.MonkeyPatch) -> None:
+    crate = ROCrate()
+    removed_file = File("removed.txt")
+    crate.add(removed_file)
+    # modify the public entity lists directly, instead of using add() and remove()
+    crate.data_entities.remove(removed_file)
+    appended_file = File("appended.txt")
+    crate.data_entities.append(appended_file)
+
+    files_seen_in_validate = []
+
+    def fake_validate(self: File, crate: ROCrate) -> None:
+        files_seen_in_validate.append(crate.get_by_type(File))
+
+    monkeypatch.setattr(File, "validate", fake_validate)
+    crate.validate()
+    assert files_seen_in_validate == [[appended_file]]
+    assert crate.get_by_id("removed.txt") == []
+
+
+def test_index_from_jsonld() -> None:
+    crate = ROCrate()
+    crate.add(File("file.txt", {"name": "file.txt", "contentSize": "1B"}))
+    loaded = ROCrate(jsonld=crate.as_jsonld())
+
+    assert [ent.id for ent in loaded.get_by_type(File)] == ["file.txt"]
+    assert loaded.get_by_id("./") == [loaded.root]
+    assert loaded.root["hasPart"] is loaded.data_entities
+
+    # from_jsonld() on an existing crate also keeps the root's hasPart up to date
+    crate.from_jsonld(loaded.as_jsonld())
+    assert crate.root["hasPart"] is crate.data_entities
+
+
+def test_get_validation_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    crate = ROCrate()
+    # outside of validate(), the value is built on each access
+    assert crate.get_validation_cache("test.key", lambda: 1) == 1
+    assert crate.get_validation_cache("test.key", lambda: 2) == 2
+
+    cached_values = []
+
+    def fake_validate(self: File, crate: ROCrate) -> None:
+        cached_values.append(crate.get_validation_cache("test.key", object))
+
+    monkeypatch.setattr(File, "validate", fake_validate)
+    crate.add(File("file_1.txt"), File("file_2.txt"))
+    crate.validate()
+    assert cached_values[0] is cached_values[1]
+
+    # the cached values are discarded after validate()
+    crate.validate()
+    assert cached_values[2] is not cached_values[0]
+    assert crate.get_validation_cache("test.key", lambda: 3) == 3
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(nii_dg.ro_crate, "orjson", None)
+
+    crate = ROCrate()
+    crate.add(
+        File("file.txt", {"name": "file.txt", "contentSize": "1B"}),
+        File("データ.txt", {"name": "データ.txt", "contentSize": "2B"}),
+    )
+    # orjson cannot serialize integers exceeding the 64-bit range, which json can
+    large_number = 2**64
+    crate.add(
+        DMP(
+            f"#dmp:{large_number}",
+            {
+                "dataNumber": large_number,
+                "name": "Calculated Data",
+                "description": "Result data calculated using Newton's method",
+                "hostingInstitution": {"@id": "https://ror.org/04ksd4g47"},
+                "wayOfManage": "commissioned",
+                "accessRights": "open access",
+                "creator": [{"@id": "https://ror.org/04ksd4g47"}],
+            },
+        )
+    )
+    path = tmp_path.joinpath("ro-crate-metadata.json")
+    crate.dump(path)
+
+    with path.open("r", encoding="utf-8") as f:
+        assert json.load(f) == crate.as_jsonld()
+    assert path.read_text(encoding="utf-8").startswith('{\n  "@context": ')
+
+
+def test_validate_accesses_each_url_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    accessed_urls = []
+
+    def fake_is_url_accessible(url: str) -> bool:
+        accessed_urls.append(url)
+        return True
+
+    monkeypatch.setattr(
+        nii_dg.check_functions, "is_url_accessible", fake_is_url_accessible
+    )
+    monkeypatch.setattr(nii_dg.ro_crate, "is_url_accessible", fake_is_url_accessible)
+
+    crate = ROCrate()
+    crate.add(
+        Person("https://example.com/person"),
+        License("https://example.com/license"),
+        License("https://example.com/license"),
+    )
+    crate.validate()
+
+    assert sorted(accessed_urls) == [
+        "https://example.com/license",
+        "https://example.com/person",
+    ]
+
+    # the results are not reused after validate(), as the URL may become accessible later
+    assert crate.is_url_accessible("https://example.com/person")
+    assert len(accessed_urls) == 3
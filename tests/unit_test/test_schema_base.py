@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+import json
+from typing import Any, List
+
+import pytest
+
+import nii_dg.schema.base
+from nii_dg.error import EntityError
+from nii_dg.ro_crate import ROCrate
+from nii_dg.schema.base import Organization
+
+ROR_PAYLOAD = {
+    "id": "https://ror.org/04ksd4g47",
+    "name": "National Institute of Informatics",
+    "aliases": ["NII"],
+    "acronyms": [],
+}
+
+
+@pytest.fixture
+def fake_ror_api(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    requested_urls = []
+
+    class FakeResponse:
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, *args: Any) -> None:
+            pass
+
+        def read(self) -> bytes:
+            return json.dumps(ROR_PAYLOAD).encode("utf-8")
+
+    def fake_urlopen(url: str, timeout: float) -> FakeResponse:
+        requested_urls.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(nii_dg.schema.base, "urlopen", fake_urlopen)
+
+    return requested_urls
+
+
+def test_fetch_organization_names_from_ror_api(fake_ror_api: List[str]) -> None:
+    name_list = Organization.fetch_organization_names_from_ror_api("04ksd4g47")
+
+    assert name_list == ["National Institute of Informatics", "NII"]
+    assert fake_ror_api == ["https://api.ror.org/organizations/04ksd4g47"]
+
+
+def test_organization_validate_with_ror_id(fake_ror_api: List[str]) -> None:
+    crate = ROCrate()
+    org = Organization("https://ror.org/04ksd4g47", {"name": "NII"})
+    crate.add(org)
+    org.validate(crate)
+
+    org["name"] = "Unknown Institute"
+    with pytest.raises(EntityError) as e:
+        org.validate(crate)
+    assert "registered in ROR" in str(e.value)
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 # coding: utf-8
 
-from nii_dg.entity import RootDataEntity
-from nii_dg.utils import is_instance_of_expected_type
+from typing import List
+
+import pytest
+
+from nii_dg.entity import Entity, RootDataEntity
+from nii_dg.schema.base import File, Person
+from nii_dg.utils import (group_by_referenced_entity,
+                          is_instance_of_expected_type, sum_file_size)
 
 
 def test_is_instance_of_expected_type() -> None:
@@ -40,3 +46,33 @@ def test_is_instance_of_expected_type() -> None:
     assert not is_instance_of_expected_type({"a": [1, 2], "b": [3, 4]}, "Dict[str, List[str]]")
 
     assert not is_instance_of_expected_type(RootDataEntity(), "str")
+
+
+def test_group_by_referenced_entity() -> None:
+    person_a = Person("https://example.com/a")
+    person_b = Person("https://example.com/b")
+    file_1 = File("file_1.txt", {"author": person_a})
+    file_2 = File("file_2.txt", {"author": person_b})
+    file_3 = File("file_3.txt", {"author": person_a})
+    file_4 = File("file_4.txt", {"author": {"@id": "https://example.com/a"}})
+
+    groups = group_by_referenced_entity([file_1, file_2, file_3, file_4], "author")
+    assert groups == {id(person_a): [file_1, file_3], id(person_b): [file_2]}
+
+
+def test_sum_file_size() -> None:
+    files: List[Entity] = [
+        File("file_1.txt", {"contentSize": "512KB"}),
+        File("file_2.txt", {"contentSize": "512KB"}),
+        File("file_3.txt", {"contentSize": "1MB"}),
+    ]
+    assert sum_file_size("MB", files) == 2
+    assert sum_file_size("B", files) == 2 * 1024**2
+    assert sum_file_size("MB", []) == 0
+
+    with pytest.raises(ValueError):
+        sum_file_size("XB", files)
+    with pytest.raises(ValueError):
+        sum_file_size("MB", [File("file_4.txt", {"contentSize": "1 MB"})])
+    with pytest.raises(ValueError):
+        sum_file_size("MB", [File("file_5.txt")])